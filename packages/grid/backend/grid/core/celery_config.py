@@ -1,9 +1,14 @@
+# grid absolute
+from grid.core.config import settings
+
 worker_send_task_event = False
 task_ignore_result = True
-task_time_limit = 300  # Rasswanth: should modify after optimizing PC
-task_acks_late = True
+# Rasswanth: should modify after optimizing PC
+task_time_limit = settings.CELERY_TASK_TIME_LIMIT
+task_acks_late = settings.CELERY_TASK_ACKS_LATE
+task_acks_on_failure_or_timeout = settings.CELERY_TASK_ACKS_ON_FAILURE_OR_TIMEOUT
 broker_pool_limit = 500
-worker_prefetch_multiplier = 1
+worker_prefetch_multiplier = settings.CELERY_WORKER_PREFETCH_MULTIPLIER
 task_routes = {
     "grid.worker.msg_without_reply": "main-queue",
     "delivery_mode": "transient",
@@ -100,6 +100,15 @@ class Settings(BaseSettings):
 
     DOMAIN_ASSOCIATION_REQUESTS_AUTOMATICALLY_ACCEPTED: bool = True
 
+    # Celery worker tuning. With late acks and a prefetch of 1 a slow worker
+    # cannot hoard messages while the others sit idle. The broker is RabbitMQ, so
+    # its consumer_timeout (rabbitmq/rabbitmq.conf) must stay above
+    # CELERY_TASK_TIME_LIMIT or it closes the channel of a worker mid task.
+    CELERY_TASK_TIME_LIMIT: int = 300
+    CELERY_WORKER_PREFETCH_MULTIPLIER: int = 1
+    CELERY_TASK_ACKS_LATE: bool = True
+    CELERY_TASK_ACKS_ON_FAILURE_OR_TIMEOUT: bool = False
+
     class Config:
         case_sensitive = True
 
@@ -9,6 +9,14 @@ import rich
 from .deps import DEPENDENCIES
 from .lib import is_editable_mode
 
+DEP_EMOJI = {
+    "docker": ":whale:",
+    "git": ":file_folder:",
+    "virtualbox": ":ballot_box_with_ballot:",
+    "vagrant": ":person_mountain_biking:",
+    "ansible-playbook": ":blue_book:",
+}
+
 
 class RichGroup(click.Group):
     def format_usage(
@@ -30,13 +38,7 @@ class RichGroup(click.Group):
         for dep in sorted(DEPENDENCIES.keys()):
             path = DEPENDENCIES[dep]
             installed_str = ":white_check_mark:" if path is not None else ":cross_mark:"
-            dep_emoji = ":gear:"
-            if dep == "docker":
-                dep_emoji = ":whale:"
-            if dep == "git":
-                dep_emoji = ":file_folder:"
-            if dep == "ansible-playbook":
-                dep_emoji = ":blue_book:"
+            dep_emoji = DEP_EMOJI.get(dep, ":gear:")
             table.add_row(f"{dep_emoji} {dep}", installed_str)
             # console.print(dep_emoji, dep, installed_str)
         console.print(table)
@@ -32,10 +32,35 @@ class IntermediateScalar(Scalar):
         self.poly = poly
         self.id = id if id else UID()
 
+    @property
+    def poly(self) -> BasicSymbol:
+        return self._poly
+
+    @poly.setter
+    def poly(self, poly: BasicSymbol) -> None:
+        # publish() substitutes over-budget entities out of self.poly, so everything
+        # cached from the old polynomial has to be thrown away with it
+        self._poly = poly
+        self._clear_poly_caches()
+
+    def _clear_poly_caches(self) -> None:
+        """Reset every value which is derived from self.poly"""
+        self._max_val_cache: Optional[float] = None
+        self._min_val_cache: Optional[float] = None
+        self._value_cache: Optional[float] = None
+        self._sympoly_cache: Optional[BasicSymbol] = None
+
     @property
     def sympoly(self) -> BasicSymbol:
-        """Sympy version of self.poly"""
-        return PymbolicToSympyMapper()(self.poly)
+        """Sympy version of self.poly
+
+        Arithmetic stays on the cheap pymbolic expression tree. The sympy expression
+        is only needed by the jacobian search, so it's built the first time it's
+        asked for and then reused.
+        """
+        if self._sympoly_cache is None:
+            self._sympoly_cache = PymbolicToSympyMapper()(self.poly)
+        return self._sympoly_cache
 
     def __mul__(self, other: IntermediateScalar) -> IntermediateScalar:
         raise NotImplementedError
@@ -78,28 +103,28 @@ class IntermediateScalar(Scalar):
 
     @property
     def max_val(self) -> Optional[float]:
-        if self.poly is not None:
+        if self._max_val_cache is None and self.poly is not None:
             results = flatten_and_maximize_poly(-self.poly)
             if len(results) >= 1:
-                return float(-results[-1].fun)
-        return None
+                self._max_val_cache = float(-results[-1].fun)
+        return self._max_val_cache
 
     @property
     def min_val(self) -> Optional[float]:
-        if self.poly is not None:
+        if self._min_val_cache is None and self.poly is not None:
             results = flatten_and_maximize_poly(self.poly)
             if len(results) >= 1:
-                return float(results[-1].fun)
-        return None
+                self._min_val_cache = float(results[-1].fun)
+        return self._min_val_cache
 
     @property
     def value(self) -> Optional[float]:
-        if self.poly is not None:
+        if self._value_cache is None and self.poly is not None:
             result = EM(
                 context={obj.poly.name: obj.value for obj in self.input_scalars}  # type: ignore
             )(self.poly)
-            return float(result)
-        return None
+            self._value_cache = float(result)
+        return self._value_cache
 
     def _object2proto(self) -> IntermediateScalar_PB:
         return IntermediateScalar_PB(
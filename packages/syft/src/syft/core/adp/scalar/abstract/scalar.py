@@ -7,9 +7,13 @@
 from __future__ import annotations
 
 # stdlib
+from contextlib import contextmanager
+import threading
 from typing import Any
+from typing import Iterator
 from typing import List as TypeList
 from typing import Optional
+from typing import Tuple as TypeTuple
 
 # third party
 from nacl.signing import VerifyKey
@@ -22,15 +26,77 @@ class Scalar:
     min-val and max-val.
     """
 
+    # scalars waiting to be published by the publish_batch() active on this thread
+    _batch = threading.local()
+
     def publish(
         self, acc: Any, user_key: VerifyKey, sigma: float = 1.5
     ) -> TypeList[Any]:
-        """Adversarial accountant adds Gaussian noise and publishes the scalar's value"""
+        """Adversarial accountant adds Gaussian noise and publishes the scalar's value
+
+        Inside a publish_batch() block the scalar is only queued, and the returned
+        list is filled in with its published value when the block exits. The call
+        must then use the same accountant, user key and sigma as the block.
+        """
+        pending = getattr(Scalar._batch, "pending", None)
+        if pending is not None:
+            batch_acc, batch_user_key, batch_sigma = Scalar._batch.params
+            if (
+                acc is not batch_acc
+                or user_key != batch_user_key
+                or sigma != batch_sigma
+            ):
+                raise Exception(
+                    "publish() inside a publish_batch() block must use the same acc, "
+                    "user_key and sigma as the block"
+                )
+            result: TypeList[Any] = list()
+            pending.append((self, result))
+            return result
+
         # relative
         from ...publish import publish
 
         return publish([self], acc=acc, sigma=sigma, user_key=user_key)
 
+    @staticmethod
+    @contextmanager
+    def publish_batch(
+        acc: Any, user_key: VerifyKey, sigma: float = 1.5
+    ) -> Iterator[None]:
+        """Coalesce every Scalar.publish() made in the block into one call to publish.
+
+        This is not only a speedup, the batch is accounted as a single query: each
+        entity gets one mechanism over all the scalars (one L2 norm, one Lipschitz
+        bound) instead of one per scalar, and an entity which is over budget is
+        removed from every scalar in the batch. Budget spend and outputs can
+        therefore differ from publishing the scalars one by one.
+        """
+        if getattr(Scalar._batch, "pending", None) is not None:
+            raise Exception("publish_batch() blocks can't be nested")
+
+        pending: TypeList[TypeTuple[Scalar, TypeList[Any]]] = list()
+        Scalar._batch.pending = pending
+        Scalar._batch.params = (acc, user_key, sigma)
+        try:
+            yield
+        finally:
+            Scalar._batch.pending = None
+            Scalar._batch.params = None
+
+        if len(pending) > 0:
+            # relative
+            from ...publish import publish
+
+            values = publish(
+                [scalar for scalar, _ in pending],
+                acc=acc,
+                sigma=sigma,
+                user_key=user_key,
+            )
+            for (_, result), value in zip(pending, values):
+                result.append(value)
+
     @property
     def max_val(self) -> Optional[float]:
         raise NotImplementedError
@@ -13,7 +13,7 @@ from ....proto.core.adp.scalar_pb2 import GammaScalar as GammaScalar_PB
 from ...common import UID
 from ...common.serde.serializable import serializable
 from ..entity import Entity
-from ..search import ssid2obj
+from ..search import register_scalar
 from .abstract.base_scalar import BaseScalar
 from .intermediate_gamma_scalar import IntermediateGammaScalar
 
@@ -53,7 +53,7 @@ class GammaScalar(BaseScalar, IntermediateGammaScalar):
             self, poly=var(self.ssid), min_val=min_val, max_val=max_val, id=self.id
         )
 
-        ssid2obj[self.ssid] = self
+        register_scalar(ssid=self.ssid, scalar=self)
 
     def _object2proto(self) -> GammaScalar_PB:
         kwargs = {
@@ -1,5 +1,6 @@
 # stdlib
 from typing import Any
+from typing import Dict as TypeDict
 from typing import List as TypeList
 from typing import Optional
 from typing import Tuple as TypeTuple
@@ -35,11 +36,18 @@ class IntermediateGammaScalar(IntermediateScalar):
         max_val: float,
         id: Optional[UID] = None,
     ) -> None:
-        self.poly = poly
-        self.id = id if id else UID()
+        super().__init__(poly=poly, id=id)
         self._min_val = min_val
         self._max_val = max_val
 
+    def _clear_poly_caches(self) -> None:
+        super()._clear_poly_caches()
+        # for a given self.poly the result of a jacobian search only depends on the
+        # arguments it was run with, so results are kept until self.poly is replaced
+        self._jac_cache: TypeDict[
+            TypeTuple[Optional[Entity], bool, bool, bool], Any
+        ] = {}
+
     # GammaScalar +/-/*/div other ---> GammaScalar
     def __add__(self, other: Any) -> IntermediateScalar:
         if isinstance(other, Scalar):
@@ -214,13 +222,16 @@ class IntermediateGammaScalar(IntermediateScalar):
         force_all_searches: bool = False,
         try_hessian_shortcut: bool = False,
     ) -> TypeList[optimize.OptimizeResult]:
-        return max_lipschitz_via_jacobian(
-            scalars=[self],
-            input_entity=input_entity,
-            data_dependent=data_dependent,
-            force_all_searches=force_all_searches,
-            try_hessian_shortcut=try_hessian_shortcut,
-        )  # type: ignore
+        key = (input_entity, data_dependent, force_all_searches, try_hessian_shortcut)
+        if key not in self._jac_cache:
+            self._jac_cache[key] = max_lipschitz_via_jacobian(
+                scalars=[self],
+                input_entity=input_entity,
+                data_dependent=data_dependent,
+                force_all_searches=force_all_searches,
+                try_hessian_shortcut=try_hessian_shortcut,
+            )  # type: ignore
+        return self._jac_cache[key]
 
     @property
     def max_lipschitz(self) -> float:
@@ -31,9 +31,13 @@ class IntermediatePhiScalar(IntermediateScalar):
         self, poly: BasicSymbol, entity: Entity, id: Optional[UID] = None
     ) -> None:
         super().__init__(poly=poly, id=id)
-        self._gamma: Optional[GammaScalar] = None
         self.entity = entity
 
+    def _clear_poly_caches(self) -> None:
+        super()._clear_poly_caches()
+        # self.gamma is built from the bounds and value of self.poly
+        self._gamma: Optional[GammaScalar] = None
+
     def max_lipschitz_wrt_entity(
         self,
         entity: Entity,
@@ -16,7 +16,7 @@ from ....proto.core.adp.scalar_pb2 import PhiScalar as PhiScalar_PB
 from ...common import UID
 from ...common.serde.serializable import serializable
 from ..entity import Entity
-from ..search import ssid2obj
+from ..search import register_scalar
 from .abstract.base_scalar import BaseScalar
 from .intermediate_phi_scalar import IntermediatePhiScalar
 
@@ -55,7 +55,7 @@ class PhiScalar(BaseScalar, IntermediatePhiScalar):
             self, poly=var(self.ssid), entity=self.entity, id=self.id
         )
 
-        ssid2obj[self.ssid] = self
+        register_scalar(ssid=self.ssid, scalar=self)
 
     def _object2proto(self) -> PhiScalar_PB:
         kwargs = {
@@ -40,6 +40,18 @@ from .entity import Entity
 # TypeDict[str, Union[PhiScalar, GammaScalar]]
 ssid2obj: TypeDict[str, Any] = {}  # TODO: Fix types in circular deps
 
+# every registered ssid gets a stable index in registration order, so lookup tables
+# for a polynomial are just its own symbols taken out of this shared ordering
+ssid2index: TypeDict[str, int] = {}
+index2ssid: TypeList[str] = []
+
+
+def register_scalar(ssid: str, scalar: Any) -> None:
+    ssid2obj[ssid] = scalar
+    if ssid not in ssid2index:
+        ssid2index[ssid] = len(index2ssid)
+        index2ssid.append(ssid)
+
 
 class GetSymbolsMapper(WalkMapper):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -58,9 +70,11 @@ def create_searchable_function_from_polynomial(
     """Wrap polynomial execution logic in a function usable for scipy.optimize
 
     scipy.optimize functions expect an ordered list of args as input whereas
-    sympy passes dictionaries into a .subs() function. This method just
-    wraps sympy's approach in a method which accepts a tuple of args ordered
-    according to symbol2index lookup table
+    sympy passes dictionaries into a .subs() function. This method wraps the
+    polynomial in a method which accepts a tuple of args ordered according to
+    symbol2index lookup table. Sympy polynomials are compiled with lambdify
+    once here, because the optimizer calls the result thousands of times and
+    .subs() re-walks the whole expression on every call.
     """
     if "pymbolic" in str(type(poly)):
 
@@ -70,14 +84,15 @@ def create_searchable_function_from_polynomial(
             return output
 
     else:
+        ordered_items = sorted(symbol2index.items(), key=lambda item: item[1])
+        ordered_symbols = [sym.Symbol(str(s)) for s, _ in ordered_items]
+        ordered_indices = [i for _, i in ordered_items]
+        compiled_poly = sym.lambdify(ordered_symbols, poly, modules="numpy")
 
         def _run_specific_args(
             tuple_of_args: TypeTuple,
         ) -> EM:
-            kwargs = {sym: tuple_of_args[i] for sym, i in symbol2index.items()}
-            output = poly.subs(kwargs)
-
-            return output
+            return compiled_poly(*[tuple_of_args[i] for i in ordered_indices])
 
     return _run_specific_args
 
@@ -124,38 +139,32 @@ def flatten_and_maximize_poly(
     poly: Any, force_all_searches: bool = False
 ) -> TypeList[optimize.OptimizeResult]:
 
-    mapper = GetSymbolsMapper()
-    mapper(poly)
+    i2s, s2i = create_lookup_tables_for_symbol(poly)
 
-    i2s = list(mapper.free_symbols)
-    s2i = {s: i for i, s in enumerate(i2s)}
+    rranges = [(ssid2obj[ssid].min_val, ssid2obj[ssid].max_val) for ssid in i2s]
 
-    # this code seems to make things slower - although there might be a memory
-    # improvement (i haven't checked)
-    # flattened_poly = poly.copy().subs({k:v for k,v in zip(i2s, ordered_symbols[0:len(i2s)])})
-    # flattened_s2i = {str(ordered_symbols[i]):i for s,i in s2i.items()}
-
-    flattened_poly = poly
-    flattened_s2i = {str(s): i for s, i in s2i.items()}
-
-    rranges = [
-        (ssid2obj[i2s[i].name].min_val, ssid2obj[i2s[i].name].max_val)
-        for i in range(len(s2i))
-    ]
-
-    return minimize_poly(
-        flattened_poly, *rranges, force_all_searches=force_all_searches, **flattened_s2i
-    )
+    return minimize_poly(poly, *rranges, force_all_searches=force_all_searches, **s2i)
 
 
+@lru_cache(maxsize=4096)
 def create_lookup_tables_for_symbol(
     polynomial: Any,
 ) -> TypeTuple[TypeList[str], TypeDict[str, int]]:
+    """Build the index <-> symbol tables for the free symbols of a polynomial.
+
+    The symbols are taken in their global registration order (see
+    register_scalar), so the same polynomial always gets the same tables and
+    the minimize_poly cache keys built from them line up between queries.
+    """
 
     mapper = GetSymbolsMapper()
     mapper(polynomial)
 
-    index2symbol = [str(x) for x in mapper.free_symbols]
+    # symbols which were never registered go last, ordered by name
+    index2symbol = sorted(
+        (str(x) for x in mapper.free_symbols),
+        key=lambda ssid: (ssid2index.get(ssid, len(index2ssid)), ssid),
+    )
     symbol2index = {sym: i for i, sym in enumerate(index2symbol)}
 
     return index2symbol, symbol2index
@@ -29,6 +29,100 @@ from .adp_tensor import ADPTensor
 SupportedChainType = Union[int, bool, float, np.ndarray, PassthroughTensor]
 
 
+def reduce_duplicate_terms(
+    term_tensor: np.ndarray, coeff_tensor: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge columns of the last axis which hold the exact same terms.
+
+    Two columns can only be merged if they reference the same term at every
+    position of the tensor, otherwise the last axis would become ragged. When
+    they do, the coefficients of the duplicates are summed into the first one.
+
+    Duplicates whose coefficients cancel out (e.g. ``g - g``) are left unmerged:
+    a zero coefficient turns ``x * 0`` into a bare ``0`` in pymbolic, and a scalar
+    left without any variables can't be searched for its bounds.
+    """
+    n_terms = term_tensor.shape[-1]
+    flat_terms = term_tensor.reshape(-1, n_terms)
+
+    _, first_columns, inverse = np.unique(  # type: ignore
+        flat_terms, axis=1, return_index=True, return_inverse=True
+    )
+    n_unique = len(first_columns)
+
+    if n_unique == n_terms:
+        return term_tensor, coeff_tensor
+
+    inverse = inverse.reshape(-1)
+    moved_coeffs = np.moveaxis(coeff_tensor, -1, 0)
+
+    # the summed coefficients of every group of duplicate columns
+    group_coeffs = np.zeros(
+        (n_unique,) + coeff_tensor.shape[:-1], dtype=coeff_tensor.dtype
+    )
+    np.add.at(group_coeffs, inverse, moved_coeffs)
+    cancelled = (group_coeffs == 0).reshape(n_unique, -1).any(axis=1)
+
+    # a column survives if it is the first of its group or its group cancelled out,
+    # surviving columns keep their order of first appearance
+    columns = np.arange(n_terms)
+    keep = (first_columns[inverse] == columns) | cancelled[inverse]
+    position = np.cumsum(keep) - 1
+    target = np.where(cancelled[inverse], position, position[first_columns[inverse]])
+
+    reduced_terms = term_tensor[..., keep]
+
+    # coefficients are summed along the (moved) term axis
+    reduced_coeffs = np.zeros(
+        (int(keep.sum()),) + coeff_tensor.shape[:-1], dtype=coeff_tensor.dtype
+    )
+    np.add.at(reduced_coeffs, target, moved_coeffs)
+    reduced_coeffs = np.moveaxis(reduced_coeffs, 0, -1)
+
+    return reduced_terms, reduced_coeffs
+
+
+def add_gamma_tensors(
+    tensors: Sequence[IntermediateGammaTensor],
+) -> IntermediateGammaTensor:
+    """Add many tensors with a single concatenation of their terms.
+
+    This is an opt-in helper: ``__add__`` only ever passes it two operands, so
+    chaining ``a + b + c + ...`` still copies the growing term and coeff
+    tensors at every step. Callers summing many tensors should pass them all
+    here at once to keep the work linear in the number of operands.
+    """
+    if len(tensors) == 0:
+        raise Exception("Cannot add an empty sequence of tensors")
+
+    scalar_manager = tensors[0].scalar_manager
+    for tensor in tensors[1:]:
+        if tensor.scalar_manager != scalar_manager:
+            # TODO: come up with a method for combining symbol factories
+            raise Exception("Cannot add two tensors with different symbol encodings")
+
+    # Step 1: Concatenate
+    term_tensor = np.concatenate(  # type: ignore
+        [tensor.term_tensor for tensor in tensors], axis=-1
+    )
+    coeff_tensor = np.concatenate(  # type: ignore
+        [tensor.coeff_tensor for tensor in tensors], axis=-1
+    )
+    bias_tensor = tensors[0].bias_tensor
+    for tensor in tensors[1:]:
+        bias_tensor = bias_tensor + tensor.bias_tensor
+
+    # Step 2: Reduce dimensionality if possible (look for duplicates)
+    term_tensor, coeff_tensor = reduce_duplicate_terms(term_tensor, coeff_tensor)
+
+    return IntermediateGammaTensor(
+        term_tensor=term_tensor,
+        coeff_tensor=coeff_tensor,
+        bias_tensor=bias_tensor,
+        scalar_manager=scalar_manager,
+    )
+
+
 @serializable(recursive_serde=True)
 class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
 
@@ -136,27 +230,31 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
 
         return scalars
 
-    def _values(self) -> np.array:
+    def _values(self, flat_scalars: Optional[List[Any]] = None) -> np.array:
         """WARNING: DO NOT MAKE THIS AVAILABLE TO THE POINTER!!!
         DO NOT ADD THIS METHOD TO THE AST!!!
         """
-        return np.array(list(map(lambda x: x.value, self.flat_scalars))).reshape(
-            self.shape
-        )
+        if flat_scalars is None:
+            flat_scalars = self.flat_scalars
+        return np.array(list(map(lambda x: x.value, flat_scalars))).reshape(self.shape)
 
-    def _max_values(self) -> np.array:
+    def _max_values(self, flat_scalars: Optional[List[Any]] = None) -> np.array:
         """WARNING: DO NOT MAKE THIS AVAILABLE TO THE POINTER!!!
         DO NOT ADD THIS METHOD TO THE AST!!!
         """
-        return np.array(list(map(lambda x: x.max_val, self.flat_scalars))).reshape(
+        if flat_scalars is None:
+            flat_scalars = self.flat_scalars
+        return np.array(list(map(lambda x: x.max_val, flat_scalars))).reshape(
             self.shape
         )
 
-    def _min_values(self) -> np.array:
+    def _min_values(self, flat_scalars: Optional[List[Any]] = None) -> np.array:
         """WARNING: DO NOT MAKE THIS AVAILABLE TO THE POINTER!!!
         DO NOT ADD THIS METHOD TO THE AST!!!
         """
-        return np.array(list(map(lambda x: x.min_val, self.flat_scalars))).reshape(
+        if flat_scalars is None:
+            flat_scalars = self.flat_scalars
+        return np.array(list(map(lambda x: x.min_val, flat_scalars))).reshape(
             self.shape
         )
 
@@ -183,13 +281,15 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
             output_entities.append(combined_entities)
         return output_entities
 
-    def _entities(self) -> np.array:
+    def _entities(self, flat_scalars: Optional[List[Any]] = None) -> np.array:
         """WARNING: DO NOT MAKE THIS AVAILABLE TO THE POINTER!!!
         DO NOT ADD THIS METHOD TO THE AST!!!
         """
+        if flat_scalars is None:
+            flat_scalars = self.flat_scalars
 
         output_entities = []
-        for flat_scalar in self.flat_scalars:
+        for flat_scalar in flat_scalars:
             # TODO: This will fail if the nested entity is any deeper than 2 levels- i.e. [A, [A, [A, B]]]. Recursive?
             combined_entities = DataSubjectGroup()
             for row in flat_scalar.input_entities:
@@ -476,11 +576,14 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
         # relative
         from .initial_gamma import InitialGammaTensor
 
+        # flat_scalars rebuilds every polynomial from the term tensor, so build
+        # them once and share them across the values, entities and bounds
+        flat_scalars = self.flat_scalars
         return InitialGammaTensor(
-            values=self._values().sum(axis),
-            entities=self._entities().sum(axis),
-            max_vals=self._max_values().sum(axis),
-            min_vals=self._min_values().sum(axis),
+            values=self._values(flat_scalars).sum(axis),
+            entities=self._entities(flat_scalars).sum(axis),
+            max_vals=self._max_values(flat_scalars).sum(axis),
+            min_vals=self._min_values(flat_scalars).sum(axis),
         )
 
     def prod(
@@ -489,13 +592,14 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
         # relative
         from .initial_gamma import InitialGammaTensor
 
+        flat_scalars = self.flat_scalars
         return InitialGammaTensor(
-            values=self._values().prod(axis),
-            entities=self._entities().sum(
+            values=self._values(flat_scalars).prod(axis),
+            entities=self._entities(flat_scalars).sum(
                 axis
             ),  # Entities get added (combined) instead of multiplied
-            max_vals=self._max_values().prod(axis),
-            min_vals=self._min_values().prod(axis),
+            max_vals=self._max_values(flat_scalars).prod(axis),
+            min_vals=self._min_values(flat_scalars).prod(axis),
         )
 
     def __add__(self, other: Any) -> IntermediateGammaTensor:
@@ -519,21 +623,9 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
 
         else:
 
-            if self.scalar_manager != other.scalar_manager:
-                # TODO: come up with a method for combining symbol factories
-                raise Exception(
-                    "Cannot add two tensors with different symbol encodings"
-                )
-
-            # Step 1: Concatenate
-            term_tensor = np.concatenate([self.term_tensor, other.term_tensor], axis=-1)  # type: ignore
-            coeff_tensor = np.concatenate(  # type: ignore
-                [self.coeff_tensor, other.coeff_tensor], axis=-1
-            )
-            bias_tensor = self.bias_tensor + other.bias_tensor
+            # EXPLAIN B: NEW OUTPUT becomes a 5x10x2
+            return add_gamma_tensors([self, other])
 
-        # EXPLAIN B: NEW OUTPUT becomes a 5x10x2
-        # TODO: Step 2: Reduce dimensionality if possible (look for duplicates)
         return IntermediateGammaTensor(
             term_tensor=term_tensor,
             coeff_tensor=coeff_tensor,
@@ -581,8 +673,12 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
             )
             bias_tensor = self.bias_tensor - other.bias_tensor
 
+            # Step 2: Reduce dimensionality if possible (look for duplicates)
+            term_tensor, coeff_tensor = reduce_duplicate_terms(
+                term_tensor, coeff_tensor
+            )
+
         # EXPLAIN B: NEW OUTPUT becomes a 5x10x2
-        # TODO: Step 2: Reduce dimensionality if possible (look for duplicates)
         return IntermediateGammaTensor(
             term_tensor=term_tensor,
             coeff_tensor=coeff_tensor,
@@ -636,53 +732,53 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
             if isinstance(other, SingleEntityPhiTensor):
                 other = convert_to_gamma_tensor(other)
 
-            terms = list()
-            for self_dim in range(self.term_tensor.shape[-1]):
-                for other_dim in range(other.term_tensor.shape[-1]):
-                    new_term = np.expand_dims(  # type: ignore
-                        self.term_tensor[..., self_dim]
-                        * other.term_tensor[..., other_dim],
-                        -1,
-                    )
-                    terms.append(new_term)
-
-            for self_dim in range(self.term_tensor.shape[-1]):
-                new_term = np.expand_dims(self.term_tensor[..., self_dim], -1)  # type: ignore
-                terms.append(new_term)
-
-            for other_dim in range(self.term_tensor.shape[-1]):
-                new_term = np.expand_dims(other.term_tensor[..., self_dim], -1)  # type: ignore
-                terms.append(new_term)
-
-            term_tensor = np.concatenate(terms, axis=-1)  # type: ignore
-
-            coeffs = list()
-            for self_dim in range(self.coeff_tensor.shape[-1]):
-                for other_dim in range(other.coeff_tensor.shape[-1]):
-                    new_coeff = np.expand_dims(  # type: ignore
-                        self.coeff_tensor[..., self_dim]
-                        * other.coeff_tensor[..., other_dim],
-                        -1,
-                    )
-                    coeffs.append(new_coeff)
-
-            for self_dim in range(self.coeff_tensor.shape[-1]):
-                new_coeff = np.expand_dims(  # type: ignore
-                    self.coeff_tensor[..., self_dim] * other.bias_tensor, -1
-                )
-                coeffs.append(new_coeff)
-
-            for other_dim in range(self.coeff_tensor.shape[-1]):
-                new_coeff = np.expand_dims(  # type: ignore
-                    other.coeff_tensor[..., self_dim] * self.bias_tensor, -1
-                )
-                coeffs.append(new_coeff)
+            # (ax + b) * (cy + d) = ac(xy) + ad(x) + bc(y) + bd
+            # the cross terms are built with a single broadcast outer product over
+            # the last axis rather than one slice at a time
+            cross_terms = (
+                self.term_tensor[..., :, None] * other.term_tensor[..., None, :]
+            )
+            term_tensor = np.concatenate(  # type: ignore
+                [
+                    cross_terms.reshape(*cross_terms.shape[:-2], -1),
+                    self.term_tensor,
+                    other.term_tensor,
+                ],
+                axis=-1,
+            )
 
-            coeff_tensor = np.concatenate(coeffs, axis=-1)  # type: ignore
+            cross_coeffs = (
+                self.coeff_tensor[..., :, None] * other.coeff_tensor[..., None, :]
+            )
+            coeff_tensor = np.concatenate(  # type: ignore
+                [
+                    cross_coeffs.reshape(*cross_coeffs.shape[:-2], -1),
+                    self.coeff_tensor * other.bias_tensor[..., None],
+                    other.coeff_tensor * self.bias_tensor[..., None],
+                ],
+                axis=-1,
+            )
 
             bias_tensor = self.bias_tensor * other.bias_tensor
 
-        # TODO: Step 2: Reduce dimensionality if possible (look for duplicates)
+            # K terms times M terms expands to exactly K*M + K + M terms. Anything
+            # else means a column was dropped or duplicated, and every later op on
+            # this tensor would pay for it.
+            n_self = self.term_tensor.shape[-1]
+            n_other = other.term_tensor.shape[-1]
+            n_terms = n_self * n_other + n_self + n_other
+            assert (
+                term_tensor.shape[-1] == n_terms
+            ), f"Expected {n_terms} terms but got {term_tensor.shape[-1]}"
+            assert (
+                coeff_tensor.shape[-1] == n_terms
+            ), f"Expected {n_terms} coeffs but got {coeff_tensor.shape[-1]}"
+
+            # Step 2: Reduce dimensionality if possible (look for duplicates)
+            term_tensor, coeff_tensor = reduce_duplicate_terms(
+                term_tensor, coeff_tensor
+            )
+
         return IntermediateGammaTensor(
             term_tensor=term_tensor,
             coeff_tensor=coeff_tensor,
@@ -1120,11 +1216,12 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
         # relative
         from .initial_gamma import InitialGammaTensor
 
+        flat_scalars = self.flat_scalars
         return InitialGammaTensor(
-            values=self._values().cumsum(axis),
-            entities=self._entities().cumsum(axis),
-            max_vals=self._max_values().cumsum(axis),
-            min_vals=self._min_values().cumsum(axis),
+            values=self._values(flat_scalars).cumsum(axis),
+            entities=self._entities(flat_scalars).cumsum(axis),
+            max_vals=self._max_values(flat_scalars).cumsum(axis),
+            min_vals=self._min_values(flat_scalars).cumsum(axis),
             scalar_manager=self.scalar_manager,
         )
 
@@ -1132,13 +1229,14 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
         # relative
         from .initial_gamma import InitialGammaTensor
 
+        flat_scalars = self.flat_scalars
         return InitialGammaTensor(
-            values=self._values().cumprod(axis),
-            entities=self._entities().cumsum(
+            values=self._values(flat_scalars).cumprod(axis),
+            entities=self._entities(flat_scalars).cumsum(
                 axis
             ),  # entities get summed (combined), not multiplied
-            max_vals=self._max_values().cumprod(axis),
-            min_vals=self._min_values().cumprod(axis),
+            max_vals=self._max_values(flat_scalars).cumprod(axis),
+            min_vals=self._min_values(flat_scalars).cumprod(axis),
             scalar_manager=self.scalar_manager,
         )
 
@@ -1,9 +1,11 @@
 # stdlib
+from functools import lru_cache
 from getpass import getpass
 import json
 import logging
+import os
+import socket
 import sys
-import time
 from typing import Dict
 from typing import Optional
 from typing import Type
@@ -24,11 +26,53 @@ from ...core.io.route import SoloRoute
 from ...core.node.common.client import Client
 from ...core.node.domain.client import DomainClient
 from ...core.node.network.client import NetworkClient
-from ...util import verify_tls
+from ...util import str_to_bool
 from .grid_connection import GridHTTPConnection
 
 DEFAULT_PYGRID_PORT = 80
 DEFAULT_PYGRID_ADDRESS = f"http://127.0.0.1:{DEFAULT_PYGRID_PORT}"
+REACHABLE_PROBE_TIMEOUT = 0.5
+
+# anonymous key shared by every connect() when SYFT_REUSE_ANON_KEY is set
+_ANON_SIGNING_KEY: Optional[SigningKey] = None
+
+
+@lru_cache(maxsize=8)
+def signing_key_from_hex(hex_key: str) -> SigningKey:
+    return SigningKey(hex_key.encode(), encoder=HexEncoder)
+
+
+def anonymous_signing_key() -> SigningKey:
+    # SYFT_DEV_SIGNING_KEY pins a deterministic hex encoded key for tests and CI,
+    # SYFT_REUSE_ANON_KEY reuses one generated key for the rest of the process
+    global _ANON_SIGNING_KEY
+
+    dev_key = os.environ.get("SYFT_DEV_SIGNING_KEY", "")
+    if dev_key:
+        return signing_key_from_hex(dev_key)
+
+    if not str_to_bool(os.environ.get("SYFT_REUSE_ANON_KEY", "0")):
+        return SigningKey.generate()
+
+    if _ANON_SIGNING_KEY is None:
+        _ANON_SIGNING_KEY = SigningKey.generate()
+    return _ANON_SIGNING_KEY
+
+
+def is_reachable(
+    host: str, port: int, timeout: float = REACHABLE_PROBE_TIMEOUT
+) -> bool:
+    # a bare TCP connect is enough to tell whether the host is up and is far
+    # cheaper than a full HTTP request, which can hang for the default timeout
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        return sock.connect_ex((host, port)) == 0
+    except OSError:
+        # e.g. the hostname does not resolve
+        return False
+    finally:
+        sock.close()
 
 
 def connect(
@@ -51,7 +95,7 @@ def connect(
     else:
 
         if not user_key:
-            _user_key = SigningKey.generate()
+            _user_key = anonymous_signing_key()
         else:
             _user_key = user_key
 
@@ -126,9 +170,7 @@ def login(
         grid_url = url
     elif url is None:
         grid_url = GridURL(host_or_ip="docker-host", port=port, path="/api/v1/status")
-        try:
-            requests.get(str(grid_url), verify=verify_tls())
-        except Exception:
+        if not is_reachable(grid_url.host_or_ip, grid_url.port):
             grid_url.host_or_ip = "localhost"
     else:
         grid_url = GridURL(host_or_ip=url, port=port)
@@ -155,7 +197,6 @@ def login(
         sys.stdout.write(" " + str(node.name) + "... ")
         if email is None or password is None:
             sys.stdout.write("as GUEST...")
-        time.sleep(1)  # ok maybe too fancy... but c'mon don't you want to be fancy?
         print("done!")
     else:
         print("Logging into: ...", str(node.name), " Done...")
@@ -1,6 +1,7 @@
 # stdlib
 import io
 import json
+import time
 from typing import Any
 from typing import Dict
 from typing import Optional
@@ -11,8 +12,6 @@ from typing import Union
 from google.protobuf.reflection import GeneratedProtocolMessageType
 import requests
 from requests.adapters import HTTPAdapter
-
-# from requests.adapters import TimeoutHTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 
@@ -33,22 +32,25 @@ from ...proto.grid.connections.http_connection_pb2 import (
 from ...util import verify_tls
 from ..connections.http_connection import HTTPConnection
 
-DEFAULT_TIMEOUT = 5  # seconds
+METADATA_CACHE_TTL = 30  # seconds
 
+# connections to the same node share one pooled session so repeated connect()
+# calls reuse the open TCP / TLS connection instead of handshaking every time
+_SESSION_CACHE: Dict[str, requests.Session] = {}
+# metadata url -> (fetched at, metadata bytes, possibly upgraded base url)
+_METADATA_CACHE: Dict[str, Tuple[float, bytes, str]] = {}
 
-class TimeoutHTTPAdapter(HTTPAdapter):
-    def __init__(self, *args: Any, **kwargs: Any) -> None:
-        self.timeout = DEFAULT_TIMEOUT
-        if "timeout" in kwargs:
-            self.timeout = kwargs["timeout"]
-            del kwargs["timeout"]
-        super().__init__(*args, **kwargs)
 
-    def send(self, request: Any, **kwargs: Any) -> Any:  # type:ignore
-        timeout = kwargs.get("timeout")
-        if timeout is None:
-            kwargs["timeout"] = self.timeout
-        return super().send(request, **kwargs)
+def get_session(base_url: str) -> requests.Session:
+    session = _SESSION_CACHE.get(base_url, None)
+    if session is None:
+        session = requests.Session()
+        # allow retry when connecting in CI
+        adapter = HTTPAdapter(max_retries=Retry(connect=1, backoff_factor=0.5))
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _SESSION_CACHE[base_url] = session
+    return session
 
 
 @serializable()
@@ -67,6 +69,10 @@ class GridHTTPConnection(HTTPConnection):
         self.session_token: str = ""
         self.token_type: str = "'"
 
+    @property
+    def session(self) -> requests.Session:
+        return get_session(self.base_url.base_url)
+
     @property
     def header(self) -> Dict[str, str]:
 
@@ -114,7 +120,7 @@ class GridHTTPConnection(HTTPConnection):
 
         # if sys.getsizeof(msg_bytes) < GridHTTPConnection.SIZE_THRESHOLD:
         # if True:
-        r = requests.post(
+        r = self.session.post(
             url=str(self.base_url) + route,
             data=msg_bytes,
             headers=header,
@@ -129,7 +135,7 @@ class GridHTTPConnection(HTTPConnection):
         return r
 
     def login(self, credentials: Dict) -> Tuple:
-        response = requests.post(
+        response = self.session.post(
             url=str(self.base_url) + GridHTTPConnection.LOGIN_ROUTE,
             json=credentials,
             verify=verify_tls(),
@@ -159,18 +165,17 @@ class GridHTTPConnection(HTTPConnection):
         :return: returns node metadata
         :rtype: str of bytes
         """
-        # allow retry when connecting in CI
-        session = requests.Session()
-        retry = Retry(connect=1, backoff_factor=0.5)
-        if timeout is None:
-            adapter = HTTPAdapter(max_retries=retry)
-        else:
-            adapter = TimeoutHTTPAdapter(max_retries=retry, timeout=timeout)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
         metadata_url = str(self.base_url) + "/syft/metadata"
-        response = session.get(metadata_url, verify=verify_tls())
+
+        cached = _METADATA_CACHE.get(metadata_url, None)
+        if cached is not None and time.time() - cached[0] < METADATA_CACHE_TTL:
+            _, metadata, base_url = cached
+            self.base_url = GridURL.from_url(base_url)
+            metadata_pb = Metadata_PB()
+            metadata_pb.ParseFromString(metadata)
+            return metadata_pb
+
+        response = self.session.get(metadata_url, verify=verify_tls(), timeout=timeout)
 
         # upgrade to tls if available
         try:
@@ -186,6 +191,15 @@ class GridHTTPConnection(HTTPConnection):
         metadata_pb = Metadata_PB()
         metadata_pb.ParseFromString(response.content)
 
+        # only cache a successful answer which parsed, otherwise an error page from a
+        # node which is still starting up would be served to every retry for a while
+        if response.status_code == requests.codes.ok:
+            _METADATA_CACHE[metadata_url] = (
+                time.time(),
+                response.content,
+                str(self.base_url),
+            )
+
         return metadata_pb
 
     def setup(self, **content: Dict[str, Any]) -> Any:
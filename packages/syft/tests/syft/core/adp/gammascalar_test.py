@@ -1,6 +1,10 @@
+# third party
+from pytest import approx
+
 # syft absolute
 from syft.core.adp.entity import Entity
 from syft.core.adp.scalar.gamma_scalar import GammaScalar
+from syft.core.adp.search import max_lipschitz_via_jacobian
 
 
 def test_scalar() -> None:
@@ -13,3 +17,27 @@ def test_scalar() -> None:
     bob + alice
     bob - alice
     bob * alice
+
+
+def test_max_lipschitz_via_jacobian_is_cached() -> None:
+    bob = GammaScalar(
+        value=1, min_val=-2, max_val=2, entity=Entity(name="Bob"), prime=3
+    )
+    alice = GammaScalar(
+        value=1, min_val=-1, max_val=1, entity=Entity(name="Alice"), prime=5
+    )
+    y = bob * alice + bob
+
+    result = y.max_lipschitz_via_jacobian(input_entity=bob.entity)
+    assert y.max_lipschitz_via_jacobian(input_entity=bob.entity) is result
+    assert y.max_lipschitz_via_jacobian(input_entity=alice.entity) is not result
+
+    # the cached result must match a fresh search over the same polynomial
+    fresh = max_lipschitz_via_jacobian(scalars=[y], input_entity=bob.entity)
+    assert -float(result[0][-1].fun) == approx(-float(fresh[0][-1].fun))
+    assert y.max_lipschitz_wrt_entity(entity=bob.entity) == approx(2)
+
+    # replacing the polynomial (as publish does) must invalidate the cache
+    y.poly = (bob * alice * 3 + bob).poly
+    assert y.max_lipschitz_via_jacobian(input_entity=bob.entity) is not result
+    assert y.max_lipschitz_wrt_entity(entity=bob.entity) == approx(4)
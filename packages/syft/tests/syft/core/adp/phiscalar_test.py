@@ -5,8 +5,11 @@ from pytest import approx
 # syft absolute
 import syft as sy
 from syft.core.adp.entity import Entity
+from syft.core.adp.publish import publish
 from syft.core.adp.scalar.gamma_scalar import GammaScalar
 from syft.core.adp.scalar.phi_scalar import PhiScalar
+from syft.core.adp.search import create_lookup_tables_for_symbol
+from syft.core.adp.search import ssid2index
 
 
 def test_phiscalar() -> None:
@@ -27,6 +30,18 @@ def test_phiscalar() -> None:
     assert y.entity == ent
 
 
+def test_phiscalar_lookup_tables_follow_registration_order() -> None:
+    x = PhiScalar(0, 0.01, 1)
+    y = PhiScalar(0, 0.02, 1)
+    assert ssid2index[x.ssid] < ssid2index[y.ssid]
+
+    # the order of the operands must not change the tables
+    for poly in [x.poly + y.poly, y.poly + x.poly]:
+        i2s, s2i = create_lookup_tables_for_symbol(poly)
+        assert i2s == [x.ssid, y.ssid]
+        assert s2i == {x.ssid: 0, y.ssid: 1}
+
+
 @pytest.mark.xfail
 def test_phiscalar_pointer(client: sy.VirtualMachineClient) -> None:
     x = PhiScalar(0, 0.01, 1)
@@ -49,3 +64,171 @@ def test_phiscalar_pointer(client: sy.VirtualMachineClient) -> None:
     assert y_gamma2.min_val == y_gamma.min_val  # TODO Fix this underflow
     assert y_gamma2.value + y_gamma.value == approx(2 * y_gamma.value)
     assert y_gamma2.max_val == y_gamma.max_val
+
+
+def test_intermediate_phiscalar_caches_bounds(monkeypatch) -> None:
+    x = PhiScalar(0, 0.01, 1)
+    y = x + x
+
+    min_val, value, max_val = y.min_val, y.value, y.max_val
+    assert min_val == approx(0)
+    assert value == approx(0.02)
+    assert max_val == approx(2)
+
+    # the polynomial can't change, so later reads must not search again
+    def fail(*args, **kwargs):  # type: ignore
+        raise AssertionError("bounds were searched for twice")
+
+    monkeypatch.setattr(
+        "syft.core.adp.scalar.abstract.intermediate_scalar.flatten_and_maximize_poly",
+        fail,
+    )
+    assert y.min_val == min_val
+    assert y.value == value
+    assert y.max_val == max_val
+
+
+def test_sympoly_follows_poly_reassignment() -> None:
+    x = PhiScalar(0, 0.5, 1)
+    y = PhiScalar(0, 0.25, 1)
+    z = x * 2
+    assert z.sympoly.free_symbols == {x.sympoly}
+
+    z.poly = y.poly * 2
+    assert z.sympoly.free_symbols == {y.sympoly}
+
+
+class OverBudgetOnceAccountant:
+    """Accountant stub which reports one entity as over budget on the first check"""
+
+    def __init__(self, entity: Entity) -> None:
+        self.entity = entity
+        self.checks = 0
+        self.temp_entity2ledger: dict = {}
+
+    def temp_append(self, ms: dict) -> None:
+        self.temp_entity2ledger.update(ms)
+
+    def overbudgeted_entities(self, **kwargs) -> set:  # type: ignore
+        self.checks += 1
+        return {self.entity} if self.checks == 1 else set()
+
+    def save_temp_ledger_to_longterm_ledger(self) -> None:
+        pass
+
+
+def test_publish_drops_overbudgeted_entity() -> None:
+    alice = Entity(name="Alice")
+    bob = Entity(name="Bob")
+    x = PhiScalar(0, 0.5, 1, entity=alice)
+    y = PhiScalar(0, 0.25, 1, entity=bob)
+    z = x + y
+    assert z.value == approx(0.75)
+
+    # the first mechanism pass reads (and caches) z.value before alice is removed
+    acc = OverBudgetOnceAccountant(entity=alice)
+    result = publish([z], acc=acc, user_key=None, sigma=0.0)
+
+    assert acc.checks == 2
+    assert result == [approx(0.25)]
+    # publish works on a copy, the original scalar is untouched
+    assert z.value == approx(0.75)
+
+
+class RecordingAccountant:
+    """Accountant stub which never runs out of budget and keeps every mechanism"""
+
+    def __init__(self) -> None:
+        self.temp_entity2ledger: dict = {}
+        self.ledger: list = []
+
+    def temp_append(self, ms: dict) -> None:
+        for entity, mechanisms in ms.items():
+            self.temp_entity2ledger.setdefault(entity, []).extend(mechanisms)
+
+    def overbudgeted_entities(self, **kwargs) -> set:  # type: ignore
+        return set()
+
+    def save_temp_ledger_to_longterm_ledger(self) -> None:
+        for mechanisms in self.temp_entity2ledger.values():
+            self.ledger.extend(mechanisms)
+
+
+def test_publish_batch_is_accounted_as_one_query() -> None:
+    alice = Entity(name="Alice")
+    x = PhiScalar(0, 0.5, 1, entity=alice)
+    y = PhiScalar(0, 0.25, 1, entity=alice)
+
+    separate = RecordingAccountant()
+    x.publish(acc=separate, user_key=None, sigma=0.0)
+    y.publish(acc=separate, user_key=None, sigma=0.0)
+
+    batched = RecordingAccountant()
+    with PhiScalar.publish_batch(acc=batched, user_key=None, sigma=0.0):
+        x.publish(acc=batched, user_key=None, sigma=0.0)
+        y.publish(acc=batched, user_key=None, sigma=0.0)
+
+    # one mechanism per scalar when published separately ...
+    assert [m.params["private_value"] for m in separate.ledger] == [
+        approx(0.5),
+        approx(0.25),
+    ]
+    # ... but a single joint mechanism over the L2 norm of the whole batch
+    assert len(batched.ledger) == 1
+    assert batched.ledger[0].params["private_value"] == approx(
+        (0.5 ** 2 + 0.25 ** 2) ** 0.5
+    )
+
+
+def test_publish_batch_coalesces_publish_calls(monkeypatch) -> None:
+    calls = list()
+
+    def fake_publish(scalars, acc, user_key, sigma):  # type: ignore
+        calls.append((scalars, acc, user_key, sigma))
+        return [s.value for s in scalars]
+
+    monkeypatch.setattr("syft.core.adp.publish.publish", fake_publish)
+
+    acc = RecordingAccountant()
+    x = PhiScalar(0, 0.01, 1)
+    y = PhiScalar(0, 0.02, 1)
+
+    with PhiScalar.publish_batch(acc=acc, user_key="key", sigma=2.0):
+        x_result = x.publish(acc=acc, user_key="key", sigma=2.0)
+        y_result = y.publish(acc=acc, user_key="key", sigma=2.0)
+        assert len(calls) == 0
+
+    assert calls == [([x, y], acc, "key", 2.0)]
+    assert x_result == [0.01]
+    assert y_result == [0.02]
+
+    # outside of the block scalars are published straight away again
+    assert x.publish(acc=acc, user_key="key") == [0.01]
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"acc": RecordingAccountant(), "user_key": "key", "sigma": 0.0},
+        {"user_key": "other", "sigma": 0.0},
+        {"user_key": "key", "sigma": 100.0},
+    ],
+)
+def test_publish_batch_rejects_mismatched_publish(monkeypatch, kwargs) -> None:
+    calls = list()
+    monkeypatch.setattr(
+        "syft.core.adp.publish.publish", lambda *args, **kw: calls.append(args)
+    )
+
+    acc = RecordingAccountant()
+    kwargs = {"acc": acc, **kwargs}
+    y = PhiScalar(0, 0.02, 1)
+
+    with pytest.raises(Exception, match="same acc, user_key and sigma"):
+        with PhiScalar.publish_batch(acc=acc, user_key="key", sigma=0.0):
+            y.publish(**kwargs)
+
+    # nothing was charged to either accountant
+    assert calls == []
+    assert acc.ledger == []
@@ -10,6 +10,7 @@ from syft.core.adp.vm_private_scalar_manager import (
 )
 from syft.core.tensor.autodp.dp_tensor_converter import convert_to_gamma_tensor
 from syft.core.tensor.autodp.intermediate_gamma import IntermediateGammaTensor as IGT
+from syft.core.tensor.autodp.intermediate_gamma import add_gamma_tensors
 from syft.core.tensor.autodp.single_entity_phi import SingleEntityPhiTensor as SEPT
 
 
@@ -161,6 +162,42 @@ def test_entities(sept_ishan, sept_traskmaster) -> None:
         assert j == target
 
 
+def test_add_reduces_duplicate_terms(gamma_tensor_min: IGT) -> None:
+    """Test that adding a tensor to itself merges the duplicate terms"""
+    output = gamma_tensor_min + gamma_tensor_min
+    assert isinstance(output, IGT)
+    assert output.term_tensor.shape == gamma_tensor_min.term_tensor.shape
+    assert (output.term_tensor == gamma_tensor_min.term_tensor).all()
+    assert (output.coeff_tensor == gamma_tensor_min.coeff_tensor * 2).all()
+    assert (output._values() == gamma_tensor_min._values() * 2).all()
+
+
+def test_sub_cancelling_terms(gamma_tensor_min: IGT) -> None:
+    """Test that terms which cancel out still leave a valid tensor"""
+    for output in [
+        gamma_tensor_min - gamma_tensor_min,
+        gamma_tensor_min + gamma_tensor_min * -1,
+    ]:
+        assert isinstance(output, IGT)
+        assert (output._values() == 0).all()
+        assert (output._min_values() == 0).all()
+        assert (output._max_values() == 0).all()
+
+
+def test_add_gamma_tensors(
+    gamma_tensor_min: IGT, gamma_tensor_ref: IGT, gamma_tensor_max: IGT
+) -> None:
+    """Test that adding many tensors at once matches chained addition"""
+    tensors = [gamma_tensor_min, gamma_tensor_ref, gamma_tensor_max]
+    output = add_gamma_tensors(tensors)
+    target = gamma_tensor_min + gamma_tensor_ref + gamma_tensor_max
+    assert isinstance(output, IGT)
+    assert (output.term_tensor == target.term_tensor).all()
+    assert (output.coeff_tensor == target.coeff_tensor).all()
+    assert (output.bias_tensor == target.bias_tensor).all()
+    assert (output._values() == target._values()).all()
+
+
 def test_gt(
     gamma_tensor_min: IGT,
     gamma_tensor_ref: IGT,